@@ -1,103 +1,164 @@
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Iterator
 
 import pandas as pd
-from google.cloud import bigquery
+import pyarrow as pa
+import pyarrow.compute as pc
+from google.cloud import bigquery, bigquery_storage_v1
+from google.cloud.bigquery_storage_v1 import types, writer
 
-from ..constants.query_constants import MAX_TIMESTAMP, TIMESTAMP, WHERE_CONDITION
+from ..constants.bigquery_constants import (
+    ARROW_PANDAS_DTYPES,
+    BIGQUERY_PANDAS_DTYPES,
+    STORAGE_WRITE_CHUNK_SIZE,
+    USE_STORAGE_WRITE_API,
+    WRITE_BATCH_SIZE,
+)
+from ..constants.dataframe_constants import RECORD_CREATED_AT
+from ..constants.query_constants import (
+    INT64,
+    LIMIT,
+    LIMIT_CONDITION,
+)
 from ..utils.logger import CloudLogger
 
 
 class BigQueryClient:
     """
     A client class to interact with Google BigQuery. It provides methods to perform operations
-    such as retrieving the maximum timestamp from a table, reading table data, writing data to a table,
-    and converting Pandas DataFrame columns to BigQuery-compatible data types.
+    such as reading table data, writing data to a table, and converting Pandas DataFrame
+    columns to BigQuery-compatible data types.
     """
 
     def __init__(self):
         """
-        Initializes the BigQueryClient with a logger and BigQuery client.
+        Initializes the BigQueryClient with a logger, a BigQuery client and the BigQuery
+        Storage clients. The clients are thread-safe and reused for every query and write,
+        so the gRPC channels and credentials are only set up once.
         """
         self.logger = CloudLogger(__name__)
         self.client = bigquery.Client()
+        self.bqstorage_client = bigquery_storage_v1.BigQueryReadClient()
+        self.write_client = (
+            bigquery_storage_v1.BigQueryWriteClient() if USE_STORAGE_WRITE_API else None
+        )
 
-    def get_max_timestamp(self, table_path: str) -> Optional[datetime]:
+    def _run_query(
+        self, query: str, batch_size: int = None
+    ) -> bigquery.table.RowIterator:
         """
-        Retrieves the maximum timestamp from a specified BigQuery table.
+        Runs a query and waits for its result, with an optional row limit.
 
         Args:
-            table_path (str): The full path of the BigQuery table.
+            query (str): The SQL query to execute.
+            batch_size (int, optional): The number of rows to limit the query to. Defaults to None.
 
         Returns:
-            Optional[datetime]: The maximum timestamp if found, otherwise None.
+            bigquery.table.RowIterator: The result rows of the finished query job.
         """
-        try:
-            query = f"SELECT MAX(recordCreatedAt) as max_timestamp FROM `{table_path}`"
-            self.logger.info(f"Executing query to get max timestamp: {query}")
+        query_parameters = []
+        if batch_size:
+            query += LIMIT_CONDITION
+            query_parameters.append(
+                bigquery.ScalarQueryParameter(LIMIT, INT64, batch_size)
+            )
 
-            query_job = self.client.query(query)
-            result = [dict(row.items()) for row in query_job]
+        self.logger.info("Executing query: %s", query)
+        job_config = bigquery.QueryJobConfig(query_parameters=query_parameters)
+        return self.client.query(query, job_config=job_config).result()
 
-            if result and result[0].get("max_timestamp") is not None:
-                max_timestamp = result[0]["max_timestamp"]
-                self.logger.info(
-                    f"Max timestamp for table {table_path}: {max_timestamp}"
-                )
-                return max_timestamp
-            else:
-                self.logger.warning(
-                    f"No data found or max timestamp is NULL for table {table_path}"
-                )
-                return None
+    def read_table_data(self, query: str, batch_size: int = None) -> pd.DataFrame:
+        """
+        Reads data from BigQuery based on the provided SQL query, optionally limiting the
+        number of rows. Results are downloaded as Arrow record batches through the
+        BigQuery Storage Read API; when the query returns no rows an empty DataFrame is
+        returned without opening a download.
+
+        Args:
+            query (str): The SQL query to execute.
+            batch_size (int, optional): The number of rows to limit the query to. Defaults to None.
+
+        Returns:
+            pd.DataFrame: A DataFrame containing the query results.
+        """
+        try:
+            rows = self._run_query(query, batch_size)
+            if rows.total_rows == 0:
+                self.logger.info("Query executed successfully. No new rows")
+                return pd.DataFrame()
 
+            data = rows.to_dataframe(bqstorage_client=self.bqstorage_client)
+
+            self.logger.info("Query executed successfully. Fetched %s", len(data))
+            return data
         except Exception as e:
-            self.logger.error(
-                f"Failed to get max timestamp for table {table_path}. Error: {str(e)}"
-            )
+            self.logger.error("Failed to read data for query %s. Error: %s", query, e)
             raise
 
-    def read_table_data(
-        self, query: str, max_timestamp: datetime, batch_size: int = None
-    ) -> List[Dict[str, Any]]:
+    def read_table_batches(
+        self, query: str, batch_size: int = None
+    ) -> Iterator[pd.DataFrame]:
         """
-        Reads data from a BigQuery table based on the provided SQL query, with optional parameters
-        for filtering by maximum timestamp and limiting the number of rows.
+        Streams the results of a query ordered by recordCreatedAt as a sequence of
+        DataFrames of about WRITE_BATCH_SIZE rows, so only one batch is held in memory at
+        a time. Arrow record batches from the BigQuery Storage Read API are buffered until
+        a batch is full, and rows sharing the trailing recordCreatedAt are carried into
+        the next batch, so each batch can be loaded on its own without splitting a tie on
+        the watermark.
 
         Args:
-            query (str): The SQL query to execute.
-            max_timestamp (datetime): The maximum timestamp to filter the data.
+            query (str): The SQL query to execute, ordered by recordCreatedAt.
             batch_size (int, optional): The number of rows to limit the query to. Defaults to None.
 
-        Returns:
-            List[Dict[str, Any]]: A list of dictionaries representing the query results.
+        Yields:
+            pd.DataFrame: A DataFrame containing one batch of the query results.
         """
         try:
-            if max_timestamp:
-                query += WHERE_CONDITION
-            if batch_size:
-                query += f" LIMIT {batch_size}"
-
-            self.logger.info(f"Executing query: {query}")
-            job_config = bigquery.QueryJobConfig(
-                query_parameters=[
-                    bigquery.ScalarQueryParameter(
-                        MAX_TIMESTAMP, TIMESTAMP, max_timestamp
-                    )
-                ]
+            rows = self._run_query(query, batch_size)
+            self.logger.info(
+                "Query executed successfully. Streaming %s rows", rows.total_rows
             )
-            query_job = self.client.query(query, job_config=job_config)
-            data = [dict(row.items()) for row in query_job]
+            if rows.total_rows == 0:
+                return
 
-            self.logger.info(f"Query executed successfully. Fetched {len(data)}")
-            return data
+            pending = []
+            pending_rows = 0
+            for record_batch in rows.to_arrow_iterable(
+                bqstorage_client=self.bqstorage_client
+            ):
+                pending.append(record_batch)
+                pending_rows += record_batch.num_rows
+                if pending_rows < WRITE_BATCH_SIZE:
+                    continue
+
+                table = pa.Table.from_batches(pending)
+                record_created_at = table.column(RECORD_CREATED_AT)
+                # Rows are ordered, so the trailing tie starts at its first occurrence
+                tie_start = pc.index(record_created_at, record_created_at[-1]).as_py()
+                if tie_start > 0:
+                    yield table.slice(0, tie_start).to_pandas(
+                        types_mapper=ARROW_PANDAS_DTYPES.get
+                    )
+                    table = table.slice(tie_start)
+
+                pending = table.to_batches()
+                pending_rows = table.num_rows
+
+            if pending_rows:
+                yield pa.Table.from_batches(pending).to_pandas(
+                    types_mapper=ARROW_PANDAS_DTYPES.get
+                )
         except Exception as e:
-            self.logger.error(f"Failed to read data for query {query}. Error: {str(e)}")
+            self.logger.error("Failed to read data for query %s. Error: %s", query, e)
             raise
 
     def write_to_table(self, table_path: str, data: pd.DataFrame) -> None:
         """
-        Writes data from a Pandas DataFrame to a specified BigQuery table.
+        Writes data from a Pandas DataFrame to a specified BigQuery table. The DataFrame
+        is serialized to Parquet so columns are shipped in their typed, columnar form, and
+        is loaded with a single load job so the write is all-or-nothing. Callers that need
+        smaller writes pass smaller DataFrames, as the streamed subscription pipeline does.
+        When USE_STORAGE_WRITE_API is enabled the rows are streamed through the Storage
+        Write API instead.
 
         Args:
             table_path (str): The full path of the BigQuery table.
@@ -106,25 +167,120 @@ class BigQueryClient:
         Returns:
             None
         """
+        if USE_STORAGE_WRITE_API:
+            return self.write_to_table_with_storage_api(table_path, data)
+
         try:
-            self.logger.info(f"Inserting data into {table_path}")
+            self.logger.info("Inserting data into %s", table_path)
             job_config = bigquery.LoadJobConfig(
-                write_disposition=bigquery.WriteDisposition.WRITE_APPEND
+                source_format=bigquery.SourceFormat.PARQUET,
+                write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
             )
 
-            self.logger.info("Initializing BigQuery load job")
-            job = self.client.load_table_from_dataframe(data, table_path, job_config)
+            self.logger.info("Initializing BigQuery load job for %s rows", len(data))
+            job = self.client.load_table_from_dataframe(
+                data, table_path, job_config=job_config
+            )
 
             job.result()
 
-            self.logger.info(f"Data written successfuly into table: {table_path}")
+            self.logger.info("Data written successfuly into table: %s", table_path)
             return
         except Exception:
             raise
 
+    def write_to_table_with_storage_api(
+        self, table_path: str, data: pd.DataFrame
+    ) -> None:
+        """
+        Writes data from a Pandas DataFrame to a BigQuery table using the Storage Write API.
+        Rows are appended as Arrow record batches to a pending stream which is committed
+        once all batches are acknowledged, so the write is applied atomically.
+
+        Args:
+            table_path (str): The full path of the BigQuery table (project.dataset.table).
+            data (pd.DataFrame): The Pandas DataFrame containing the data to write.
+
+        Returns:
+            None
+        """
+        try:
+            self.logger.info("Streaming data into %s via Storage Write API", table_path)
+            if self.write_client is None:
+                self.write_client = bigquery_storage_v1.BigQueryWriteClient()
+            write_client = self.write_client
+            project, dataset, table = table_path.split(".")
+            parent = write_client.table_path(project, dataset, table)
+
+            write_stream = write_client.create_write_stream(
+                parent=parent,
+                write_stream=types.WriteStream(type_=types.WriteStream.Type.PENDING),
+            )
+
+            arrow_table = pa.Table.from_pandas(data, preserve_index=False)
+            # BigQuery expects Arrow timestamps with microsecond precision
+            arrow_table = arrow_table.cast(
+                pa.schema(
+                    [
+                        (
+                            field.with_type(pa.timestamp("us", tz=field.type.tz))
+                            if pa.types.is_timestamp(field.type)
+                            else field
+                        )
+                        for field in arrow_table.schema
+                    ]
+                )
+            )
+            request_template = types.AppendRowsRequest(write_stream=write_stream.name)
+            request_template.arrow_rows.writer_schema.serialized_schema = (
+                arrow_table.schema.serialize().to_pybytes()
+            )
+            append_rows_stream = writer.AppendRowsStream(write_client, request_template)
+            try:
+                futures = []
+                for batch in arrow_table.to_batches(
+                    max_chunksize=STORAGE_WRITE_CHUNK_SIZE
+                ):
+                    request = types.AppendRowsRequest()
+                    request.arrow_rows.rows.serialized_record_batch = (
+                        batch.serialize().to_pybytes()
+                    )
+                    futures.append(append_rows_stream.send(request))
+
+                for future in futures:
+                    future.result()
+            finally:
+                append_rows_stream.close()
+
+            write_client.finalize_write_stream(name=write_stream.name)
+            response = write_client.batch_commit_write_streams(
+                types.BatchCommitWriteStreamsRequest(
+                    parent=parent, write_streams=[write_stream.name]
+                )
+            )
+            # A rejected commit is reported in the response rather than raised
+            if response.stream_errors or not response.commit_time:
+                errors = (
+                    "; ".join(
+                        f"{error.code.name} {error.entity}: {error.error_message}"
+                        for error in response.stream_errors
+                    )
+                    or "no commit time returned"
+                )
+                raise RuntimeError(
+                    f"Failed to commit write stream {write_stream.name}: {errors}"
+                )
+
+            self.logger.info("Data written successfuly into table: %s", table_path)
+        except Exception as e:
+            self.logger.error("Failed to stream data into %s. Error: %s", table_path, e)
+            raise
+
     def convert_to_bigquery_dtype(self, df, column_dtype_map):
         """
         Converts the data types of specified columns in a Pandas DataFrame to BigQuery-compatible data types.
+        Numeric and datetime columns are coerced in one pass each and all casts are applied
+        with a single astype call. Missing values are kept as nulls.
 
         Args:
             df (pd.DataFrame): The Pandas DataFrame to convert.
@@ -133,19 +289,36 @@ class BigQueryClient:
         Returns:
             pd.DataFrame: The DataFrame with converted data types.
         """
-        for column, bq_type in column_dtype_map.items():
-            if column not in df.columns:
-                continue
-
-            if bq_type == "STRING":
-                df[column] = df[column].astype(str)
-            elif bq_type == "INTEGER":
-                df[column] = pd.to_numeric(df[column], errors="coerce").astype("Int64")
-            elif bq_type == "FLOAT":
-                df[column] = pd.to_numeric(df[column], errors="coerce")
-            elif bq_type == "BOOLEAN":
-                df[column] = df[column].astype(bool)
-            elif bq_type == "DATETIME":
-                df[column] = pd.to_datetime(df[column], errors="coerce")
-
-        return df
+        column_dtype_map = {
+            column: bq_type
+            for column, bq_type in column_dtype_map.items()
+            if column in df.columns
+        }
+
+        numeric_columns = [
+            column
+            for column, bq_type in column_dtype_map.items()
+            if bq_type in ("INTEGER", "FLOAT")
+        ]
+        if numeric_columns:
+            df[numeric_columns] = df[numeric_columns].apply(
+                pd.to_numeric, errors="coerce"
+            )
+
+        datetime_columns = [
+            column
+            for column, bq_type in column_dtype_map.items()
+            if bq_type == "DATETIME"
+        ]
+        if datetime_columns:
+            df[datetime_columns] = df[datetime_columns].apply(
+                pd.to_datetime, errors="coerce"
+            )
+
+        return df.astype(
+            {
+                column: BIGQUERY_PANDAS_DTYPES[bq_type]
+                for column, bq_type in column_dtype_map.items()
+                if bq_type in BIGQUERY_PANDAS_DTYPES
+            }
+        )
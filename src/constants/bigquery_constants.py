@@ -0,0 +1,32 @@
+import os
+
+import db_dtypes
+import pandas as pd
+import pyarrow as pa
+
+# Feature flag: load through the BigQuery Storage Write API instead of load jobs
+USE_STORAGE_WRITE_API = os.getenv("USE_STORAGE_WRITE_API", "false").lower() == "true"
+
+# Rows per streamed subscription batch, each loaded with its own load job
+WRITE_BATCH_SIZE = int(os.getenv("WRITE_BATCH_SIZE", "50000"))
+if WRITE_BATCH_SIZE <= 0:
+    raise ValueError(f"WRITE_BATCH_SIZE must be a positive integer: {WRITE_BATCH_SIZE}")
+
+# Rows serialized into a single AppendRows request (requests are capped at 10MB)
+STORAGE_WRITE_CHUNK_SIZE = 10_000
+
+# Pandas dtypes used when casting DataFrame columns to their BigQuery column types
+BIGQUERY_PANDAS_DTYPES = {
+    "STRING": "string",
+    "INTEGER": "Int64",
+    "FLOAT": "float64",
+    "BOOLEAN": "boolean",
+}
+
+# Pandas dtypes for Arrow result columns, matching the defaults of RowIterator.to_dataframe
+ARROW_PANDAS_DTYPES = {
+    pa.bool_(): pd.BooleanDtype(),
+    pa.int64(): pd.Int64Dtype(),
+    pa.date32(): db_dtypes.DateDtype(),
+    pa.time64("us"): db_dtypes.TimeDtype(),
+}
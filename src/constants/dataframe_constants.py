@@ -21,3 +21,24 @@ MULTIVIST_ADJUSTED_MINUTES = "multivisitAdjustedMinutes"
 DRIVE_TIME = "driveTime"
 VALUE = "value"
 TOTAL_TIME = "totalTime"
+RECORD_CREATED_AT = "recordCreatedAt"
+MAJOR_BUCKET = "majorBucket"
+
+# Boolean helper columns derived from the major recurring bucket of the service type
+SUBSCRIPTION_BUCKET_COLUMNS = {
+    "residentialGeneralPest": "Residential - General Pest",
+    "commercialGeneralPest": "Commercial - General Pest",
+    "woodDestroying": "Wood Destroying",
+    "mosquito": "Mosquito",
+    "other": "Other",
+}
+APPOINTMENT_BUCKET_COLUMNS = {
+    "residentialGreenPest": "Residential - General Pest",
+    "commercialGreenPest": "Commercial - General Pest",
+    "woodDestroying": "Wood Destroying",
+    "mosquito": "Mosquito",
+    "other": "Other",
+    "residentialBasic": "Residential - basic",
+    "residentialPremium": "Residential - Premium",
+    "residentialPlus": "Residential - Plus",
+}
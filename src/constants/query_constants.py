@@ -13,26 +13,6 @@ SELECT
     END AS adjEndDate,
   lkp.majorRecurringBucket as majorBucket,
   lkp.minorRecurringBucket as minorBucket,
-  CASE
-    WHEN lkp.majorRecurringBucket = 'Residential - General Pest' then TRUE
-    else FALSE
-  END AS residentialGeneralPest,
-  CASE
-    WHEN lkp.majorRecurringBucket = 'Commercial - General Pest' then TRUE
-    else FALSE
-  END as commercialGeneralPest,
-  CASE
-    WHEN lkp.majorRecurringBucket = 'Wood Destroying' then TRUE
-    else FALSE
-  END as woodDestroying,
-  CASE
-    WHEN lkp.majorRecurringBucket = 'Mosquito' then TRUE
-    else FALSE
-  END as mosquito,
-  CASE
-    WHEN lkp.majorRecurringBucket = 'Other' then TRUE
-    else FALSE
-  END as other,
   sub.recordCreatedAt,
   sub.clientId,
   sub.crmSource
@@ -63,38 +43,7 @@ sub.masterAccountID,
     lkp.isRervice as isReservice,
     lkp.isRecurring as includedType,
     lkp.allocateReservices as countForReservice,
-    CASE
-        WHEN lkp.majorRecurringBucket = 'Residential - General Pest' then TRUE
-        else FALSE
-    END AS residentialGreenPest,
-      CASE
-        WHEN lkp.majorRecurringBucket = 'Commercial - General Pest' then TRUE
-        else FALSE
-      END as commercialGreenPest,
-      CASE
-        WHEN lkp.majorRecurringBucket = 'Wood Destroying' then TRUE
-        else FALSE
-      END as woodDestroying,
-      CASE
-        WHEN lkp.majorRecurringBucket = 'Mosquito' then TRUE
-        else FALSE
-      END as mosquito,
-      CASE
-        WHEN lkp.majorRecurringBucket = 'Other' then TRUE
-        else FALSE
-      END as other,
-      CASE
-        WHEN lkp.majorRecurringBucket = 'Residential - basic' then TRUE
-        else FALSE
-      END as residentialBasic,
-      CASE
-        WHEN lkp.majorRecurringBucket = 'Residential - Premium' then TRUE
-        else FALSE
-      END as residentialPremium,
-      CASE
-        WHEN lkp.majorRecurringBucket = 'Residential - Plus' then TRUE
-        else FALSE
-      END as residentialPlus,
+    lkp.majorRecurringBucket as majorBucket,
       sub.recordCreatedAt,
       sub.clientId,
       sub.crmSource
@@ -104,6 +53,24 @@ join `pco-qa.raw_layer.temp_lkp_service_type` as lkp on lkp.serviceType = sub.ty
 
 T_SUBSCRIPTION_HELPER = """pco-qa.transformation_layer.t_subscription_helper"""
 T_APPOINTMENT_HELPER = """pco-qa.transformation_layer.t_appointment_helper"""
-WHERE_CONDITION = " WHERE sub.recordCreatedAt > @max_timestamp"
-TIMESTAMP = "TIMESTAMP"
-MAX_TIMESTAMP = "max_timestamp"
+WHERE_CONDITION = """ WHERE sub.recordCreatedAt > (
+  SELECT IFNULL(MAX(recordCreatedAt), TIMESTAMP("1970-01-01 00:00:00"))
+  FROM `{target_table}`
+)"""
+ORDER_BY_CONDITION = " ORDER BY sub.recordCreatedAt"
+LIMIT_CONDITION = " LIMIT @limit"
+INT64 = "INT64"
+LIMIT = "limit"
+
+# Incremental source queries, filtered on the watermark of their target table. The
+# subscription rows are streamed and loaded batch by batch, so they are read in
+# watermark order.
+T_SUBSCRIPTION_HELPER_INCREMENTAL_QUERY = (
+    T_SUBSCRIPTION_HELPER_QUERY
+    + WHERE_CONDITION.format(target_table=T_SUBSCRIPTION_HELPER)
+    + ORDER_BY_CONDITION
+)
+T_APPOINTMENT_HELPER_INCREMENTAL_QUERY = (
+    T_APPOINTMENT_HELPER_QUERY
+    + WHERE_CONDITION.format(target_table=T_APPOINTMENT_HELPER)
+)
@@ -1,11 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 from ..bigquery.client import BigQueryClient
 from ..constants.query_constants import (
     T_APPOINTMENT_HELPER,
-    T_APPOINTMENT_HELPER_QUERY,
+    T_APPOINTMENT_HELPER_INCREMENTAL_QUERY,
     T_SUBSCRIPTION_HELPER,
-    T_SUBSCRIPTION_HELPER_QUERY,
+    T_SUBSCRIPTION_HELPER_INCREMENTAL_QUERY,
 )
 from ..transformation.transformations import DataTransformer
 from ..utils.logger import CloudLogger
@@ -34,7 +35,12 @@ class ETLService:
         self.transformer = DataTransformer(client)
 
     def _process_data(
-        self, query: str, table_name: str, transformation_method, process_name: str
+        self,
+        query: str,
+        table_name: str,
+        transformation_method,
+        process_name: str,
+        stream: bool = False,
     ):
         """
         Generic method to process data with common error handling and logging.
@@ -43,39 +49,65 @@ class ETLService:
             query_constant: Table or query constant
             transformation_method: Transformation method from transformer
             process_name: Name of the process for logging
+            stream: Read, transform and load the source rows batch by batch. Only valid
+                for transformations that compute each output row from its own input row
+                and for queries ordered by recordCreatedAt.
         """
         start_time = datetime.now(timezone.utc)
         self.logger.info(
-            f"Starting data processing for {process_name}",
+            "Starting data processing for %s",
+            process_name,
             timestamp=start_time.isoformat(),
         )
         try:
-            max_timestamp = self.client.get_max_timestamp(table_name)
-            raw_data = self.client.read_table_data(query, max_timestamp, None)
+            if stream:
+                for batch in self.client.read_table_batches(query, None):
+                    df = transformation_method(batch)
+                    self.client.write_to_table(table_name, df)
+            else:
+                raw_data = self.client.read_table_data(query, None)
 
-            if raw_data:
-                df = transformation_method(raw_data)
-                self.client.write_to_table(table_name, df)
+                if not raw_data.empty:
+                    df = transformation_method(raw_data)
+                    self.client.write_to_table(table_name, df)
 
-            self.logger.info(f"Completed data processing for {process_name}")
+            self.logger.info("Completed data processing for %s", process_name)
         except Exception as e:
-            self.logger.error(f"Error processing {process_name}: {str(e)}")
+            self.logger.error("Error processing %s: %s", process_name, e)
             raise
 
     def process_subscription(self):
         """Process subscription data using generic method."""
         self._process_data(
-            T_SUBSCRIPTION_HELPER_QUERY,
+            T_SUBSCRIPTION_HELPER_INCREMENTAL_QUERY,
             T_SUBSCRIPTION_HELPER,
             self.transformer.subscription_helper_transformation,
             "subscription",
+            stream=True,
         )
 
     def process_appointment(self):
         """Process appointment data using generic method."""
         self._process_data(
-            T_APPOINTMENT_HELPER_QUERY,
+            T_APPOINTMENT_HELPER_INCREMENTAL_QUERY,
             T_APPOINTMENT_HELPER,
             self.transformer.appointment_helper_transformation,
             "appointment",
         )
+
+    def process_all(self):
+        """
+        Process subscription and appointment data concurrently.
+
+        The two pipelines share no data, so running them on separate threads overlaps
+        their BigQuery job latency. Errors from either pipeline are re-raised once both
+        have finished.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self.process_subscription),
+                executor.submit(self.process_appointment),
+            ]
+
+        for future in futures:
+            future.result()
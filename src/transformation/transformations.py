@@ -1,11 +1,12 @@
 from datetime import time
-from typing import Any, Dict, List
+from typing import Dict
 
 import numpy as np
 import pandas as pd
 
 from ..bigquery.client import BigQueryClient
 from ..constants.dataframe_constants import (
+    APPOINTMENT_BUCKET_COLUMNS,
     APPOINTMENT_DATE,
     AVERAGE_MINUTES,
     CONSTAINED_TIME,
@@ -14,6 +15,7 @@ from ..constants.dataframe_constants import (
     DURATION,
     FILL_IN_ERRORS,
     IS_ERROR,
+    MAJOR_BUCKET,
     MASTER_ACCOUNT_ID,
     MINUTES_OUTLIER_OUT,
     MULTIVISIT_COUNT,
@@ -25,6 +27,7 @@ from ..constants.dataframe_constants import (
     PREFERRED_END,
     PREFERRED_START,
     STATUS,
+    SUBSCRIPTION_BUCKET_COLUMNS,
     TIME_IN,
     TIME_OUT,
     TOTAL_TIME,
@@ -56,14 +59,12 @@ class DataTransformer:
         self.logger = CloudLogger(__name__)
         self.validator = DataValidation()
 
-    def subscription_helper_transformation(
-        self, data: List[Dict[str, Any]]
-    ) -> pd.DataFrame:
+    def subscription_helper_transformation(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Transforms subscription-related data into a structured DataFrame.
 
         Args:
-            data (List[Dict[str, Any]]): A list of dictionaries representing subscription data.
+            data (pd.DataFrame): A DataFrame containing subscription data.
 
         Returns:
             pd.DataFrame: A transformed DataFrame with constrained time information.
@@ -78,32 +79,41 @@ class DataTransformer:
             PREFERRED_END: [time],
         }
 
-        df = self.validator.validate_dataframe(data, required_columns, type_checks)
+        df = self.validator.validate_dataframe(
+            data, required_columns, "subscription", type_checks=type_checks
+        )
+
+        if df.empty:
+            return df
 
         try:
-            df[CONSTAINED_TIME] = (
-                (df[PREFERRED_DAYS] > 0)
-                & (df[PREFERRED_START] > time(0, 0, 0))
-                & (df[PREFERRED_END] > time(0, 0, 0))
+            midnight = time(0, 0, 0)
+            df[CONSTAINED_TIME] = np.logical_and.reduce(
+                (
+                    (df[PREFERRED_DAYS] > 0).to_numpy(dtype=bool, na_value=False),
+                    (df[PREFERRED_START] > midnight).to_numpy(
+                        dtype=bool, na_value=False
+                    ),
+                    (df[PREFERRED_END] > midnight).to_numpy(dtype=bool, na_value=False),
+                )
             )
+            df = self.compute_bucket_flags(df, SUBSCRIPTION_BUCKET_COLUMNS)
 
-            df.drop(
-                columns=[PREFERRED_DAYS, PREFERRED_START, PREFERRED_END], inplace=True
+            return df.reindex(
+                columns=df.columns.difference(
+                    [PREFERRED_DAYS, PREFERRED_START, PREFERRED_END], sort=False
+                )
             )
-
-            return df
         except Exception as e:
-            self.logger.error(f"subscription transformation failed: {str(e)}")
+            self.logger.error("subscription transformation failed: %s", e)
             raise
 
-    def appointment_helper_transformation(
-        self, data: List[Dict[str, Any]]
-    ) -> pd.DataFrame:
+    def appointment_helper_transformation(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Transforms appointment-related data into a structured DataFrame.
 
         Args:
-            data (List[Dict[str, Any]]): A list of dictionaries representing appointment data.
+            data (pd.DataFrame): A DataFrame containing appointment data.
 
         Returns:
             pd.DataFrame: A transformed DataFrame with multivisit and timing information.
@@ -124,164 +134,208 @@ class DataTransformer:
         type_checks = {
             MASTER_ACCOUNT_ID: [int, np.integer],
             STATUS: [int, np.integer],
-            CRM_MINUTES: [float, np.floating],
-            DURATION: [float, np.floating],
+            CRM_MINUTES: [int, np.integer, float, np.floating],
+            DURATION: [int, np.integer, float, np.floating],
         }
 
-        df = self.validator.validate_dataframe(data, required_columns, type_checks)
+        df = self.validator.validate_dataframe(
+            data, required_columns, "appointment", type_checks=type_checks
+        )
 
         try:
-            # Multivist condition calculation
-            multivisit_condition = (
-                df.groupby([MASTER_ACCOUNT_ID, APPOINTMENT_DATE])
-                .apply(lambda group: (group[STATUS] == 1).sum() > 1)
-                .reset_index(name=MULTIVIST)
+            # Compact numeric group keys keep every groupby on the hashtable fast path
+            df[MASTER_ACCOUNT_ID] = df[MASTER_ACCOUNT_ID].astype("Int64")
+            df[APPOINTMENT_DATE] = pd.to_datetime(df[APPOINTMENT_DATE]).astype(
+                "datetime64[ns]"
             )
 
-            # Merge and transformations
-            df = df.merge(
-                multivisit_condition,
-                on=[MASTER_ACCOUNT_ID, APPOINTMENT_DATE],
-                how="left",
-            )
-
-            df[IS_ERROR] = df[CRM_MINUTES] == 0.0
-            df[MINUTES_OUTLIER_OUT] = df.apply(self.compute_minutes_outlier_out, axis=1)
-            df[FILL_IN_ERRORS] = df.apply(self.compute_fill_in_errors, axis=1)
-
-            # Filtered and grouped calculations
-            df_filtered = df[df[STATUS] == 1]
-            df[MULTIVIST_DURATION] = df_filtered.groupby(
-                [MASTER_ACCOUNT_ID, APPOINTMENT_DATE]
-            )[DURATION].transform("sum")
-            # Compute multivist CRM time
-            df = self.compute_multivist_crm_time(df)
+            # Hash the (account, date) key once; every grouped calculation reuses the codes
+            group_codes = df.groupby(
+                [MASTER_ACCOUNT_ID, APPOINTMENT_DATE], sort=False, observed=True
+            ).ngroup()
 
-            # Multivist count calculation
-            multivisit_count_df = (
-                df.groupby([MASTER_ACCOUNT_ID, APPOINTMENT_DATE])
-                .apply(lambda group: (group[STATUS] == 1).sum())
-                .reset_index(name=MULTIVISIT_COUNT)
-            )
+            df = self.compute_bucket_flags(df, APPOINTMENT_BUCKET_COLUMNS)
 
-            # Merge and numeric conversions
-            df = df.merge(
-                multivisit_count_df,
-                on=[MASTER_ACCOUNT_ID, APPOINTMENT_DATE],
-                how="left",
+            # Multivist count and condition calculation
+            completed = (df[STATUS] == 1).fillna(False).astype(np.int32)
+            df[MULTIVISIT_COUNT] = completed.groupby(group_codes, sort=False).transform(
+                "sum"
             )
+            df[MULTIVIST] = df[MULTIVISIT_COUNT] > 1
 
-            # Safe numeric conversions with error handling
-            numeric_columns = [
-                MULTIVISIT_CRM_TIME,
-                MULTIVISIT_COUNT,
+            # Duration of completed appointments summed per account and day
+            completed_duration = df[DURATION].where(df[STATUS] == 1, 0.0)
+            df[MULTIVIST_DURATION] = completed_duration.groupby(
+                group_codes, sort=False
+            ).transform("sum")
+            # Compute multivist CRM time
+            df = self.compute_multivist_crm_time(df, group_codes)
+
+            df = self.compute_time_columns(df)
+
+            # Keep the output columns in a single projection
+            input_only_columns = [
+                MASTER_ACCOUNT_ID,
+                APPOINTMENT_DATE,
+                TIME_IN,
+                TIME_OUT,
+                STATUS,
+                DURATION,
                 VALUE,
-                FILL_IN_ERRORS,
-                MINUTES_OUTLIER_OUT,
+                AVERAGE_MINUTES,
+                MAJOR_BUCKET,
             ]
-            for col in numeric_columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-
-            # Compute derived columns
-            df[MULTIVIST_ADJUSTED_MINUTES] = np.where(
-                df[MULTIVIST],
-                df[MULTIVISIT_CRM_TIME] / df[MULTIVISIT_COUNT],
-                df[FILL_IN_ERRORS],
-            )
-
-            df[DRIVE_TIME] = df[VALUE] / df[MULTIVISIT_COUNT].replace(0, np.nan)
-            df[TOTAL_TIME] = df[DRIVE_TIME].fillna(0) + df[
-                MULTIVIST_ADJUSTED_MINUTES
-            ].fillna(0)
-
-            df.drop(
-                columns=[
-                    MASTER_ACCOUNT_ID,
-                    APPOINTMENT_DATE,
-                    TIME_IN,
-                    TIME_OUT,
-                    STATUS,
-                    DURATION,
-                    VALUE,
-                    AVERAGE_MINUTES,
-                ],
-                inplace=True,
+            df = df.reindex(
+                columns=df.columns.difference(input_only_columns, sort=False)
             )
 
             df = self.client.convert_to_bigquery_dtype(df, column_types)
 
             return df
         except Exception as e:
-            self.logger.error(f"Appointment transformation failed: {str(e)}")
+            self.logger.error("Appointment transformation failed: %s", e)
             raise
 
-    def compute_minutes_outlier_out(self, row: pd.Series) -> float:
+    def compute_bucket_flags(
+        self, df: pd.DataFrame, bucket_columns: Dict[str, str]
+    ) -> pd.DataFrame:
         """
-        Computes the outlier-adjusted CRM minutes for a given row.
+        Computes one boolean column per major recurring bucket.
 
         Args:
-            row (pd.Series): A row of data containing status, duration, and CRM minutes.
+            df (pd.DataFrame): The DataFrame containing the major bucket column.
+            bucket_columns (Dict[str, str]): A mapping of output column names to bucket names.
 
         Returns:
-            float: The outlier-adjusted CRM minutes.
+            pd.DataFrame: The updated DataFrame with the bucket flag columns.
         """
-        if row[STATUS] == 1:
-            return max(min(row[DURATION] * 2, row[CRM_MINUTES]), row[DURATION] * 0.25)
-        else:
-            return 0.0
+        for column, bucket in bucket_columns.items():
+            df[column] = (df[MAJOR_BUCKET] == bucket).to_numpy(
+                dtype=bool, na_value=False
+            )
+
+        return df
 
-    def compute_fill_in_errors(self, row: pd.Series) -> float:
+    def compute_time_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Computes the error-adjusted CRM minutes for a given row.
+        Computes the per-appointment time columns in one pass over the underlying NumPy
+        arrays, reusing buffers instead of materializing a DataFrame column per step:
+
+        - isErr: whether the CRM time is an error, i.e. 0 minutes were recorded.
+        - minutesOutlierOut: CRM minutes bounded to between a quarter and twice the
+          scheduled duration for completed appointments, twice the duration when the
+          CRM time is missing, 0.0 otherwise.
+        - fillInErrors: the service type's average minutes where the CRM time is an
+          error, the outlier-adjusted minutes otherwise.
+        - multivisitAdjustedMinutes: the multivisit CRM time split across the visits of
+          the day for multivisit appointments, the fill-in minutes otherwise.
+        - driveTime: the drive time assumption split across the visits of the day, 0.0
+          when there is no completed visit.
+        - totalTime: drive time plus adjusted minutes, treating missing values as 0.
 
         Args:
-            row (pd.Series): A row of data containing error status and average minutes.
+            df (pd.DataFrame): The DataFrame containing appointment data with the multivisit
+                columns already computed.
 
         Returns:
-            float: The error-adjusted CRM minutes.
+            pd.DataFrame: The updated DataFrame with the time columns calculated.
         """
-        if row[IS_ERROR]:
-            return row[AVERAGE_MINUTES]
-        else:
-            return row[MINUTES_OUTLIER_OUT]
+        completed = (df[STATUS] == 1).to_numpy(dtype=bool, na_value=False)
+        multivisit = df[MULTIVIST].to_numpy(dtype=bool, na_value=False)
+        duration = df[DURATION].to_numpy(dtype=np.float64, na_value=np.nan)
+        crm_minutes = df[CRM_MINUTES].to_numpy(dtype=np.float64, na_value=np.nan)
+        average_minutes = df[AVERAGE_MINUTES].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        value = df[VALUE].to_numpy(dtype=np.float64, na_value=np.nan)
+        multivisit_count = df[MULTIVISIT_COUNT].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        multivisit_crm_time = df[MULTIVISIT_CRM_TIME].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+
+        is_error = crm_minutes == 0.0
+
+        # Same NULL handling as Python's min/max: a NULL CRM time never replaces a bound
+        upper_bound = duration * 2
+        outlier_out = np.where(crm_minutes < upper_bound, crm_minutes, upper_bound)
+        lower_bound = duration * 0.25
+        outlier_out = np.where(lower_bound > outlier_out, lower_bound, outlier_out)
+        outlier_out[~completed] = 0.0
+
+        fill_in_errors = np.where(is_error, average_minutes, outlier_out)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            adjusted_minutes = np.where(
+                multivisit, multivisit_crm_time / multivisit_count, fill_in_errors
+            )
+
+        drive_time = np.divide(
+            value,
+            multivisit_count,
+            out=np.zeros_like(value),
+            where=multivisit_count > 0,
+        )
 
-    def compute_multivist_crm_time(self, df: pd.DataFrame) -> pd.DataFrame:
+        total_time = np.nan_to_num(adjusted_minutes, nan=0.0)
+        total_time += np.nan_to_num(drive_time, nan=0.0)
+
+        df[IS_ERROR] = pd.array(is_error, dtype="boolean")
+        df[MINUTES_OUTLIER_OUT] = outlier_out
+        df[FILL_IN_ERRORS] = fill_in_errors
+        df[MULTIVIST_ADJUSTED_MINUTES] = adjusted_minutes
+        df[DRIVE_TIME] = drive_time
+        df[TOTAL_TIME] = total_time
+
+        return df
+
+    def compute_multivist_crm_time(
+        self, df: pd.DataFrame, group_codes: pd.Series
+    ) -> pd.DataFrame:
         """
-        Computes the total CRM time for multivisit appointments.
+        Computes the total CRM time of a multivisit day. The (account, date) visit window
+        of completed appointments is clamped to between 0.25 and 2 times the day's
+        multivisit duration, the same bounds minutesOutlierOut applies per appointment,
+        so every completed visit of the day carries the same total.
 
         Args:
             df (pd.DataFrame): The DataFrame containing appointment data.
+            group_codes (pd.Series): The (account, date) group number of every row.
 
         Returns:
             pd.DataFrame: The updated DataFrame with multivisit CRM time calculated.
         """
-        max_times = (
-            df[df[STATUS] == 1]
-            .groupby([MASTER_ACCOUNT_ID, APPOINTMENT_DATE])[TIME_OUT]
-            .max()
+        completed = (df[STATUS] == 1).to_numpy(dtype=bool, na_value=False)
+        visit_window = (
+            df.loc[completed, [TIME_OUT, TIME_IN]]
+            .groupby(group_codes[completed], sort=False)
+            .agg(max_time_out=(TIME_OUT, "max"), min_time_in=(TIME_IN, "min"))
         )
 
-        min_times = (
-            df[df[STATUS] == 1]
-            .groupby([MASTER_ACCOUNT_ID, APPOINTMENT_DATE])[TIME_IN]
-            .min()
+        time_diff = (
+            visit_window["max_time_out"] - visit_window["min_time_in"]
+        ).dt.total_seconds() / 60
+
+        row_time_diff = time_diff.reindex(group_codes).to_numpy(
+            dtype=np.float64, na_value=np.nan
         )
+        row_time_diff = np.nan_to_num(row_time_diff, nan=0.0)
 
-        time_diff = (max_times - min_times).dt.total_seconds() / 60
-
-        def calculate_value(row):
-            if row[MULTIVIST] and row[STATUS] == 1:
-                min(
-                    row[DURATION] * 0.25,
-                    max(
-                        2 * row[DURATION],
-                        time_diff.get(
-                            (row[MASTER_ACCOUNT_ID], row[APPOINTMENT_DATE]), 0
-                        ),
-                    ),
-                )
-            return 0.0
+        multivisit_duration = df[MULTIVIST_DURATION].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        multivisit_completed = (
+            df[MULTIVIST].to_numpy(dtype=bool, na_value=False) & completed
+        )
 
-        df[MULTIVISIT_CRM_TIME] = df.apply(calculate_value, axis=1)
+        df[MULTIVISIT_CRM_TIME] = np.where(
+            multivisit_completed,
+            np.maximum(
+                multivisit_duration * 0.25,
+                np.minimum(multivisit_duration * 2, row_time_diff),
+            ),
+            0.0,
+        )
 
         return df
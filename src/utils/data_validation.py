@@ -1,9 +1,21 @@
-from typing import Any, Dict, List
+from datetime import time
+from typing import Dict, List
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_float_dtype, is_integer_dtype
 
 from .logger import CloudLogger
 
+# Dtype predicates for the value types accepted in type checks
+_DTYPE_PREDICATES = {
+    int: is_integer_dtype,
+    np.integer: is_integer_dtype,
+    float: is_float_dtype,
+    np.floating: is_float_dtype,
+    time: lambda column: column.dtype == object or column.dtype.name == "dbtime",
+}
+
 
 class DataValidation:
     """
@@ -19,38 +31,40 @@ class DataValidation:
         """
         self.logger = CloudLogger(__name__)
 
-    def is_empty(self, data: List[Dict[str, Any]], table: str) -> bool:
+    def is_empty(self, data: pd.DataFrame, table: str) -> bool:
         """
         Checks if the provided data is empty.
 
         Args:
-            data (List[Dict[str, Any]]): A list of dictionaries representing the data.
+            data (pd.DataFrame): A DataFrame representing the data.
             table (str): The name of the table being checked.
 
         Returns:
             bool: True if the data is empty, False otherwise.
         """
-        if not data:
-            self.logger.info(f"No data reveived for {table}")
+        if data.empty:
+            self.logger.info("No data reveived for %s", table)
             return True
         return False
 
     def validate_dataframe(
         self,
-        data: List[Dict[str, Any]],
+        data: pd.DataFrame,
         required_columns: List[str],
         helper_log: str,
         type_checks: Dict[str, List[type]] = None,
     ) -> pd.DataFrame:
         """
-        Validates the input data and converts it into a pandas DataFrame.
+        Validates the input DataFrame.
 
         Args:
-            data (List[Dict[str, Any]]): A list of dictionaries representing the data.
+            data (pd.DataFrame): A DataFrame representing the data.
             required_columns (List[str]): A list of required column names to validate.
             helper_log (str): A log string to identify the validation process.
             type_checks (Dict[str, List[type]], optional): A dictionary specifying
-                column names as keys and a list of allowed data types as values.
+                column names as keys and a list of allowed value types as values
+                (int, np.integer, float, np.floating or time), checked against the
+                column dtype.
 
         Returns:
             pd.DataFrame: A validated pandas DataFrame.
@@ -62,18 +76,17 @@ class DataValidation:
         if self.is_empty(data, helper_log):
             return pd.DataFrame()
 
-        df = pd.DataFrame(data)
-
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        missing_columns = set(required_columns).difference(data.columns)
         if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}")
+            raise ValueError(f"Missing required columns: {sorted(missing_columns)}")
 
         if type_checks:
             for col, allowed_types in type_checks.items():
-                if col in df.columns:
-                    if not any(isinstance(df[col].dtype, t) for t in allowed_types):
+                if col in data.columns:
+                    column = data[col]
+                    if not any(_DTYPE_PREDICATES[t](column) for t in allowed_types):
                         raise TypeError(
-                            f"columns {col} has incorrect type: {df[col].dtype}"
+                            f"columns {col} has incorrect type: {column.dtype}"
                         )
 
-        return df
+        return data
@@ -1,5 +1,15 @@
+import functools
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+
+@functools.lru_cache(maxsize=None)
+def _get_logger(name: str) -> logging.Logger:
+    """Configure root logging on first use and return the named logger, once per name."""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO)
+
+    return logging.getLogger(name)
 
 
 class CloudLogger:
@@ -11,41 +21,54 @@ class CloudLogger:
         Args:
             name (str, optional): The name of the logger instance. Defaults to current module name.
         """
-        if not logging.getLogger().handlers:
-            logging.basicConfig(level=logging.INFO)
-
-        self._std_logger = logging.getLogger(name)
+        self._std_logger = _get_logger(name)
 
-    def _format_message(self, message: str, kwargs: Dict[str, Any]) -> str:
-        """Format message with additional context if provided."""
-        return f"{message} {kwargs}" if kwargs else message
+    def _format_message(
+        self, message: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Tuple[Any, ...]:
+        """Append additional context, if provided, as a lazily formatted argument."""
+        if not kwargs:
+            return (message, *args)
+        # Without args the message was never a format string, so keep any % literal
+        if not args:
+            message = message.replace("%", "%%")
+        return (f"{message} %s", *args, kwargs)
 
-    def info(self, message: str, **kwargs: Any) -> None:
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
         """
         Logs an informational message that will automatically be sent to Cloud Logging.
 
         Args:
             message: The message to be logged.
+            *args: Values merged into the message using %-style formatting, only when the
+                record is emitted.
             **kwargs: Additional key-value pairs that will appear in the Cloud Logging entry.
         """
-        self._std_logger.info(self._format_message(message, kwargs))
+        if self._std_logger.isEnabledFor(logging.INFO):
+            self._std_logger.info(*self._format_message(message, args, kwargs))
 
-    def error(self, message: str, **kwargs: Any) -> None:
+    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
         """
         Logs an error message that will automatically be sent to Cloud Logging.
 
         Args:
             message: The error message to be logged.
+            *args: Values merged into the message using %-style formatting, only when the
+                record is emitted.
             **kwargs: Additional key-value pairs that will appear in the Cloud Logging entry.
         """
-        self._std_logger.error(self._format_message(message, kwargs))
+        if self._std_logger.isEnabledFor(logging.ERROR):
+            self._std_logger.error(*self._format_message(message, args, kwargs))
 
-    def warning(self, message: str, **kwargs: Any) -> None:
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
         """
         Logs a warning message that will automatically be sent to Cloud Logging.
 
         Args:
             message: The warning message to be logged.
+            *args: Values merged into the message using %-style formatting, only when the
+                record is emitted.
             **kwargs: Additional key-value pairs that will appear in the Cloud Logging entry.
         """
-        self._std_logger.warning(self._format_message(message, kwargs))
+        if self._std_logger.isEnabledFor(logging.WARNING):
+            self._std_logger.warning(*self._format_message(message, args, kwargs))
@@ -0,0 +1,95 @@
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from src.transformation.transformations import DataTransformer
+
+
+def appointment_rows(rows):
+    """Builds an appointment DataFrame with the source columns the transformation reads."""
+    data = pd.DataFrame(
+        rows,
+        columns=[
+            "masterAccountID",
+            "appointmentDate",
+            "status",
+            "duration",
+            "timeIn",
+            "timeOut",
+            "crmMinutes",
+        ],
+    )
+    data["masterAccountID"] = data["masterAccountID"].astype("Int64")
+    data["appointmentDate"] = pd.to_datetime(data["appointmentDate"]).dt.date
+    data["status"] = data["status"].astype("Int64")
+    data["duration"] = data["duration"].astype("float64")
+    data["crmMinutes"] = data["crmMinutes"].astype("float64")
+    data["timeIn"] = pd.to_datetime(data["timeIn"], utc=True)
+    data["timeOut"] = pd.to_datetime(data["timeOut"], utc=True)
+    data["value"] = 10.0
+    data["AverageMinutes"] = 20.0
+    data["majorBucket"] = "Other"
+    return data
+
+
+@pytest.fixture
+def transformer():
+    client = mock.Mock()
+    client.convert_to_bigquery_dtype.side_effect = lambda df, column_types: df
+    return DataTransformer(client)
+
+
+def test_multivisit_crm_time_is_the_day_window_within_the_day_duration(transformer):
+    data = appointment_rows(
+        [
+            # 150 minute window, 90 minutes of completed duration: window kept
+            (1, "2024-01-01", 1, 60, "2024-01-01 08:00", "2024-01-01 09:00", 60),
+            (1, "2024-01-01", 1, 30, "2024-01-01 10:00", "2024-01-01 10:30", 30),
+            # Not completed: ignored for the window, the duration and the count
+            (1, "2024-01-01", 2, 45, "2024-01-01 06:00", "2024-01-01 12:00", 0),
+            # 300 minute window, 60 minutes of completed duration: capped at 120
+            (2, "2024-01-01", 1, 30, "2024-01-01 08:00", "2024-01-01 08:30", 30),
+            (2, "2024-01-01", 1, 30, "2024-01-01 12:30", "2024-01-01 13:00", 30),
+            # 20 minute window, 120 minutes of completed duration: raised to 30
+            (3, "2024-01-01", 1, 60, "2024-01-01 08:00", "2024-01-01 08:10", 60),
+            (3, "2024-01-01", 1, 60, "2024-01-01 08:10", "2024-01-01 08:20", 60),
+            # Single visit: no multivisit CRM time
+            (4, "2024-01-01", 1, 30, "2024-01-01 08:00", "2024-01-01 08:40", 40),
+        ]
+    )
+
+    result = transformer.appointment_helper_transformation(data)
+
+    assert result["multivisitCrmTime"].tolist() == [
+        150.0,
+        150.0,
+        0.0,
+        120.0,
+        120.0,
+        30.0,
+        30.0,
+        0.0,
+    ]
+    assert result["multivisitAdjustedMinutes"].tolist() == [
+        75.0,
+        75.0,
+        0.0,
+        60.0,
+        60.0,
+        15.0,
+        15.0,
+        40.0,
+    ]
+
+
+def test_missing_crm_minutes_take_the_upper_outlier_bound(transformer):
+    data = appointment_rows(
+        [(1, "2024-01-01", 1, 45, "2024-01-01 08:00", "2024-01-01 08:30", None)]
+    )
+
+    result = transformer.appointment_helper_transformation(data)
+
+    assert result["minutesOutlierOut"].tolist() == [90.0]
+    assert result["fillInErrors"].tolist() == [90.0]
+    assert result["totalTime"].tolist() == [100.0]